@@ -0,0 +1,12 @@
+import functools
+import warnings
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=None)
+def bootstrap():
+    """One-time process setup shared by all entry points: warning filters and .env loading."""
+    # Suppress urllib3 NotOpenSSLWarning on macOS (must run before any imports that use urllib3)
+    warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
+    load_dotenv()
@@ -1,28 +1,29 @@
-import warnings
-# Suppress urllib3 NotOpenSSLWarning on macOS (must be before any imports that use urllib3)
-warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
+from bootstrap import bootstrap
+# Warning filters + .env (must run before any imports that use urllib3 or read env)
+bootstrap()
 
 import os
 import argparse
-from dotenv import load_dotenv
-from search import search_prompt, search_documents
-
-load_dotenv()
+from search import search_prompt, stream_documents
 
 EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "openai").lower()
 
+def parse_provider():
+    """Resolve the session provider from CLI args (overrides EMBEDDING_PROVIDER)"""
+    parser = argparse.ArgumentParser(description="Chat com documentos usando múltiplos provedores de embeddings/LLM.")
+    parser.add_argument("--provider", choices=["openai", "google"], help="Provedor a usar nesta sessão (sobrepõe EMBEDDING_PROVIDER)")
+    args, unknown = parser.parse_known_args()
+    return args.provider if args.provider else EMBEDDING_PROVIDER
+
 def main():
     """Main chat interface"""
+    # Resolve configuration once, before entering the chat loop
+    chosen_provider = parse_provider()
+
     print("=== Chat com Documentos ===")
     print("Digite 'sair' para encerrar o chat")
     print("Digite 'ajuda' para ver instruções")
     print("-" * 40)
-    
-    # Parse CLI args
-    parser = argparse.ArgumentParser(description="Chat com documentos usando múltiplos provedores de embeddings/LLM.")
-    parser.add_argument("--provider", choices=["openai", "google"], help="Provedor a usar nesta sessão (sobrepõe EMBEDDING_PROVIDER)")
-    args, unknown = parser.parse_known_args()
-    chosen_provider = args.provider if args.provider else EMBEDDING_PROVIDER
 
     print(f"Provedor selecionado: {chosen_provider}")
 
@@ -60,12 +61,12 @@ def main():
             if not user_input:
                 continue
             
-            # Get answer from search
+            # Stream answer from search as it is generated
             print("Processando...")
-            answer = search_documents(user_input, chain)
-            
-            # Display answer
-            print(f"\nAssistente: {answer}")
+            print("\nAssistente: ", end="", flush=True)
+            for chunk in stream_documents(user_input, chain, provider=chosen_provider):
+                print(chunk, end="", flush=True)
+            print()
             
         except KeyboardInterrupt:
             print("\n\nEncerrando chat...")
@@ -0,0 +1,97 @@
+import hashlib
+import sqlite3
+import threading
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that persists vectors in SQLite keyed by (text, model).
+
+    Vectors are stored as raw float32 bytes. The model name is part of the key, so
+    changing the embedding model naturally misses the cache instead of reusing stale vectors.
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, path: str = "embeddings.sqlite"):
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, kind: str, text: str) -> str:
+        # Queries and documents may be embedded differently (e.g. Google task types)
+        payload = f"{self.model_name}\0{kind}\0{text}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+    def _lookup(self, keys):
+        """Return a dict with the cached vectors found for the given keys."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                found.update((key, np.frombuffer(blob, dtype=np.float32).tolist()) for key, blob in rows)
+        return found
+
+    def _store(self, keys, vectors):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector) VALUES (?, ?)",
+                ((key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in zip(keys, vectors)),
+            )
+            self._conn.commit()
+
+    def _prepare(self, texts):
+        keys = [self._key("document", text) for text in texts]
+        cached = self._lookup(keys)
+        # Deduplicate misses so repeated chunks are embedded only once
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                pending.setdefault(key, text)
+        return keys, cached, list(pending), list(pending.values())
+
+    def _complete(self, keys, cached, missing, vectors):
+        if missing:
+            self._store(missing, vectors)
+            cached.update(zip(missing, vectors))
+        return [cached[key] for key in keys]
+
+    def embed_documents(self, texts):
+        keys, cached, missing, missing_texts = self._prepare(texts)
+        vectors = self.embeddings.embed_documents(missing_texts) if missing else []
+        return self._complete(keys, cached, missing, vectors)
+
+    async def aembed_documents(self, texts):
+        keys, cached, missing, missing_texts = self._prepare(texts)
+        vectors = await self.embeddings.aembed_documents(missing_texts) if missing else []
+        return self._complete(keys, cached, missing, vectors)
+
+    def embed_query(self, text):
+        key = self._key("query", text)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key]
+        vector = self.embeddings.embed_query(text)
+        self._store([key], [vector])
+        return vector
+
+    async def aembed_query(self, text):
+        key = self._key("query", text)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key]
+        vector = await self.embeddings.aembed_query(text)
+        self._store([key], [vector])
+        return vector
@@ -0,0 +1,48 @@
+import threading
+
+import numpy as np
+
+
+def _normalize(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """In-memory cache of answers looked up by cosine similarity of the question embedding."""
+
+    def __init__(self, threshold: float = 0.97):
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._vectors = None  # (n, dim) matrix of unit vectors
+        self._answers = []
+
+    def lookup(self, vector):
+        """Return the cached answer of the most similar past question, or None below threshold."""
+        with self._lock:
+            if not self._answers:
+                return None
+            scores = self._vectors @ _normalize(vector)
+            best = int(np.argmax(scores))
+            return self._answers[best] if scores[best] >= self.threshold else None
+
+    def store(self, vector, answer):
+        row = _normalize(vector)[np.newaxis, :]
+        with self._lock:
+            self._vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+            self._answers.append(answer)
+
+
+_caches = {}
+
+
+def get_semantic_cache(namespace: str, threshold: float = 0.97) -> SemanticCache:
+    """Return the cache for a namespace (e.g. provider + LLM model), creating it on first use.
+
+    A later call with a different threshold updates it for the existing cache.
+    """
+    if namespace not in _caches:
+        _caches[namespace] = SemanticCache(threshold)
+    _caches[namespace].threshold = threshold
+    return _caches[namespace]